@@ -11,6 +11,7 @@ import {
 } from "./github.js";
 import {
   fetchGitlabMrInfo,
+  fetchGitlabMrDiscussions,
   postGitlabMrComment,
   getGitlabMrDiffRefs,
   getGitlabMrDiffLineMap,
@@ -82,7 +83,21 @@ export function detectPlatform(prUrl: string): Platform {
   );
 }
 
+// The same PR URL is re-parsed at every layer of a run — CLI dispatch, the
+// review loop, comment posting — so successful parses are memoized. Failures
+// are not cached; they throw each time. The cached object is shared: callers
+// only ever read it.
+const parsedPrUrlCache = new Map<string, ParsedPrUrl>();
+
 export function parsePrUrl(prUrl: string): ParsedPrUrl {
+  const cached = parsedPrUrlCache.get(prUrl);
+  if (cached) return cached;
+  const parsed = parsePrUrlUncached(prUrl);
+  parsedPrUrlCache.set(prUrl, parsed);
+  return parsed;
+}
+
+function parsePrUrlUncached(prUrl: string): ParsedPrUrl {
   const url = new URL(prUrl);
   const pathParts = url.pathname.split("/").filter(Boolean);
   const host = url.host;
@@ -362,12 +377,29 @@ export async function postReviewStructured(opts: {
 
   const parsed = parsePrUrl(prUrl);
 
+  // Fetch the MR's discussions once; both the resolver below and the duplicate
+  // check further down read the same paginated endpoint, so sharing the payload
+  // drops a full paginated round-trip from every posting operation.
+  let rawDiscussions: Array<Record<string, unknown>> | undefined;
+  try {
+    rawDiscussions = await fetchGitlabMrDiscussions(
+      parsed.owner,
+      parsed.repo,
+      parsed.prNumber,
+      parsed.host,
+    );
+  } catch (err) {
+    logger.warn(`Failed to prefetch MR discussions: ${err instanceof Error ? err.message : err}`);
+  }
+
   try {
     const discussions = await listHodorDiscussions(
       parsed.owner,
       parsed.repo,
       parsed.prNumber,
       parsed.host,
+      undefined,
+      rawDiscussions,
     );
     const unresolvedIds = [...new Set(
       discussions.filter((d) => !d.resolved).map((d) => d.discussionId),
@@ -412,7 +444,13 @@ export async function postReviewStructured(opts: {
   // prior Hodor run) or another finding already accepted in this same batch.
   let dedupedReview: ReviewOutput = review;
   try {
-    const existingNotes = await listAllMrNotes(parsed.owner, parsed.repo, parsed.prNumber, parsed.host);
+    const existingNotes = await listAllMrNotes(
+      parsed.owner,
+      parsed.repo,
+      parsed.prNumber,
+      parsed.host,
+      rawDiscussions,
+    );
     const existingComments: ExistingComment[] = existingNotes.map((n) => ({
       path: n.filePath,
       line: n.line,
@@ -451,6 +489,17 @@ export async function postReviewStructured(opts: {
   // well as new_line — otherwise the draft is created but bulk_publish 500s.
   const diffLineMap = await getGitlabMrDiffLineMap(parsed.owner, parsed.repo, parsed.prNumber, parsed.host);
 
+  // First pass: resolve each finding to a positioned draft-note payload (or
+  // skip it). The posting itself happens in parallel batches below — draft
+  // notes are independent POSTs, so serializing them just stacks N round-trips.
+  const pendingNotes: Array<{
+    title: string;
+    body: string;
+    relPath: string;
+    anchorLine: number;
+    oldLine: number | undefined;
+  }> = [];
+
   for (const finding of dedupedReview.findings) {
     const relPath = formatLocationRelative(finding.code_location, workspacePath);
     const priorityTag = `[P${finding.priority}]`;
@@ -496,28 +545,43 @@ export async function postReviewStructured(opts: {
       continue;
     }
     // Added line -> new_line only; context line -> both old_line and new_line.
-    const oldLine = linePos && !linePos.added ? linePos.oldLine : undefined;
+    const oldLine = linePos && !linePos.added ? linePos.oldLine ?? undefined : undefined;
 
-    try {
-      await createGitlabDraftNote(
-        parsed.owner,
-        parsed.repo,
-        parsed.prNumber,
-        body,
-        parsed.host,
-        {
-          filePath: relPath,
-          line: anchorLine,
-          oldLine,
-          diffRefs,
-        },
-      );
-      inlineCount++;
-    } catch (err) {
-      const msg = err instanceof Error ? err.message : String(err);
-      logger.warn(`Failed to create inline note for "${finding.title}": ${msg}`);
-      postingErrors.push(`inline note: ${msg}`);
-      failedCount++;
+    pendingNotes.push({ title: finding.title, body, relPath, anchorLine, oldLine });
+  }
+
+  // Post draft notes in bounded batches. GitLab comfortably absorbs a handful
+  // of concurrent POSTs per client; a review with 20 findings goes from 20
+  // serial round-trips to 4 batched ones.
+  const DRAFT_NOTE_CONCURRENCY = 5;
+  for (let i = 0; i < pendingNotes.length; i += DRAFT_NOTE_CONCURRENCY) {
+    const batch = pendingNotes.slice(i, i + DRAFT_NOTE_CONCURRENCY);
+    const results = await Promise.allSettled(
+      batch.map((note) =>
+        createGitlabDraftNote(
+          parsed.owner,
+          parsed.repo,
+          parsed.prNumber,
+          note.body,
+          parsed.host,
+          {
+            filePath: note.relPath,
+            line: note.anchorLine,
+            oldLine: note.oldLine,
+            diffRefs,
+          },
+        ),
+      ),
+    );
+    for (const [j, result] of results.entries()) {
+      if (result.status === "fulfilled") {
+        inlineCount++;
+      } else {
+        const msg = result.reason instanceof Error ? result.reason.message : String(result.reason);
+        logger.warn(`Failed to create inline note for "${batch[j].title}": ${msg}`);
+        postingErrors.push(`inline note: ${msg}`);
+        failedCount++;
+      }
     }
   }
 
@@ -614,12 +678,11 @@ export async function postReviewStructured(opts: {
   };
 }
 
-// Paths that waste context without contributing reviewable logic.
-const DIFF_SKIP_PATTERNS: RegExp[] = [
-  /(?:^|\/)testdata\//,                                         // test fixture directories
-  /(?:^|\/)(?:package-lock\.json|yarn\.lock|pnpm-lock\.yaml|go\.sum|Cargo\.lock|poetry\.lock|Gemfile\.lock|composer\.lock)$/,
-  /\.mdx?$/,                                                    // markdown docs
-];
+// Paths that waste context without contributing reviewable logic: test fixture
+// directories, lockfiles, and markdown docs. A single alternation so each path
+// is scanned once instead of once per pattern.
+const DIFF_SKIP_PATTERN =
+  /(?:^|\/)(?:testdata\/|(?:package-lock\.json|yarn\.lock|pnpm-lock\.yaml|go\.sum|Cargo\.lock|poetry\.lock|Gemfile\.lock|composer\.lock)$)|\.mdx?$/;
 
 export function filterEmbeddedDiff(rawDiff: string): { filtered: string; skippedFiles: string[] } {
   const skippedFiles: string[] = [];
@@ -633,7 +696,7 @@ export function filterEmbeddedDiff(rawDiff: string): { filtered: string; skipped
       continue;
     }
     const filePath = match[1];
-    if (DIFF_SKIP_PATTERNS.some((re) => re.test(filePath))) {
+    if (DIFF_SKIP_PATTERN.test(filePath)) {
       skippedFiles.push(filePath);
     } else {
       kept.push(section);
@@ -1050,31 +1113,43 @@ export async function reviewPr(opts: {
   let activeSession: AgentSession | undefined;
 
   try {
-    let mrMetadata: MrMetadata | null = null;
+    // Kick off the platform metadata fetch and (for GitLab) the authoritative
+    // MR diff fetch together — independent API round-trips, so the slower one
+    // bounds the wait instead of their sum.
+    let metadataPromise: Promise<MrMetadata | null> = Promise.resolve(null);
     if (!localMode && platform === "gitlab") {
-      try {
-        mrMetadata = await fetchGitlabMrInfo(owner, repo, prNumber, host, {
-          includeComments: true,
-        });
-      } catch (err) {
+      metadataPromise = fetchGitlabMrInfo(owner, repo, prNumber, host, {
+        includeComments: true,
+      }).catch((err: unknown) => {
         logger.warn(`Failed to fetch GitLab metadata: ${err}`);
-      }
+        return null;
+      });
     } else if (!localMode && platform === "github") {
-      try {
-        const githubRaw = await fetchGithubPrInfo(owner, repo, prNumber);
-        mrMetadata = normalizeGithubMetadata(githubRaw);
-      } catch (err) {
-        logger.warn(`Failed to fetch GitHub metadata: ${err}`);
-      }
-    } else if (!localMode && platform === "gitea") {
-      try {
-        mrMetadata = await fetchGiteaPrInfo(owner, repo, prNumber, host, {
-          includeComments: true,
+      metadataPromise = fetchGithubPrInfo(owner, repo, prNumber)
+        .then(normalizeGithubMetadata)
+        .catch((err: unknown) => {
+          logger.warn(`Failed to fetch GitHub metadata: ${err}`);
+          return null;
         });
-      } catch (err) {
+    } else if (!localMode && platform === "gitea") {
+      metadataPromise = fetchGiteaPrInfo(owner, repo, prNumber, host, {
+        includeComments: true,
+      }).catch((err: unknown) => {
         logger.warn(`Failed to fetch Gitea metadata: ${err}`);
-      }
+        return null;
+      });
     }
+    const mrDiffPromise =
+      !localMode && platform === "gitlab"
+        ? getGitlabMrUnifiedDiff(owner, repo, prNumber, host).catch((err: unknown) => {
+            logger.warn(
+              `Failed to fetch authoritative GitLab MR diff: ${err instanceof Error ? err.message : err}`,
+            );
+            return null;
+          })
+        : null;
+
+    const mrMetadata = await metadataPromise;
 
     // Detect previous Hodor review SHA for incremental mode. GitLab returns MR
     // notes newest-first by default, so select by timestamp instead of taking
@@ -1112,23 +1187,19 @@ export async function reviewPr(opts: {
     let gitlabAuthoritativeDiff: string | null = null;
     let gitlabMrDiffText: string | null = null;
     let tooLargeFiles: string[] = [];
-    if (!localMode && platform === "gitlab") {
-      try {
-        const mrDiff = await getGitlabMrUnifiedDiff(owner, repo, prNumber, host);
-        if (mrDiff) {
-          mrChangedFiles = mrDiff.files;
-          gitlabMrDiffText = mrDiff.diff;
-          tooLargeFiles = mrDiff.tooLargeFiles;
-          if (tooLargeFiles.length > 0) {
-            logger.warn(`GitLab omitted content for ${tooLargeFiles.length} too-large file(s); the agent is told to inspect them directly`);
-          }
-          // Incremental reviews already diff `previousReviewSha...HEAD` (a
-          // correct three-dot range that excludes upstream changes); only full
-          // reviews need the API diff to dodge the stale two-dot base.
-          if (!previousReviewSha) gitlabAuthoritativeDiff = mrDiff.diff;
+    if (mrDiffPromise) {
+      const mrDiff = await mrDiffPromise;
+      if (mrDiff) {
+        mrChangedFiles = mrDiff.files;
+        gitlabMrDiffText = mrDiff.diff;
+        tooLargeFiles = mrDiff.tooLargeFiles;
+        if (tooLargeFiles.length > 0) {
+          logger.warn(`GitLab omitted content for ${tooLargeFiles.length} too-large file(s); the agent is told to inspect them directly`);
         }
-      } catch (err) {
-        logger.warn(`Failed to fetch authoritative GitLab MR diff: ${err instanceof Error ? err.message : err}`);
+        // Incremental reviews already diff `previousReviewSha...HEAD` (a
+        // correct three-dot range that excludes upstream changes); only full
+        // reviews need the API diff to dodge the stale two-dot base.
+        if (!previousReviewSha) gitlabAuthoritativeDiff = mrDiff.diff;
       }
     }
     const diffRestrictPaths =
@@ -1210,7 +1281,9 @@ export async function reviewPr(opts: {
       jiraContext,
     });
 
-    const startTime = Date.now();
+    // Monotonic clock: review duration must not jump with NTP/wall-clock
+    // adjustments over a multi-minute agent run.
+    const startTime = performance.now();
     const settingsManager = SettingsManager.inMemory({
       compaction: { enabled: true },
     });
@@ -1573,7 +1646,7 @@ export async function reviewPr(opts: {
           `Captured ${review.findings.length} finding(s), verdict: ${review.overall_correctness}`,
         );
 
-        const durationSeconds = (Date.now() - startTime) / 1000;
+        const durationSeconds = (performance.now() - startTime) / 1000;
         logger.info(`Review complete (${review.findings.length} finding(s))`);
 
         // Aggregate usage from all assistant messages
@@ -1600,14 +1673,14 @@ export async function reviewPr(opts: {
         let cost = 0;
 
         for (const msg of allMessages) {
-          if (msg.role === "assistant" && msg.usage) {
-            inputTokens += msg.usage.input ?? 0;
-            outputTokens += msg.usage.output ?? 0;
-            cacheReadTokens += msg.usage.cacheRead ?? 0;
-            cacheWriteTokens += msg.usage.cacheWrite ?? 0;
-            totalTokens += msg.usage.totalTokens ?? 0;
-            cost += msg.usage.cost?.total ?? 0;
-          }
+          const usage = msg.role === "assistant" ? msg.usage : undefined;
+          if (!usage) continue;
+          inputTokens += usage.input ?? 0;
+          outputTokens += usage.output ?? 0;
+          cacheReadTokens += usage.cacheRead ?? 0;
+          cacheWriteTokens += usage.cacheWrite ?? 0;
+          totalTokens += usage.totalTokens ?? 0;
+          cost += usage.cost?.total ?? 0;
         }
 
         const metrics: ReviewMetrics = {
@@ -46,6 +46,24 @@ function requireGiteaToken(): string {
   return token;
 }
 
+// Longest Retry-After the client will actually honor; anything larger means
+// the server wants us gone for a while and failing fast is more useful.
+const MAX_RETRY_AFTER_MS = 30 * 1000;
+
+/**
+ * Delay a rate-limited request should wait before retrying, from the
+ * Retry-After header (numeric-seconds form). Null when the header is absent,
+ * unparseable, or asks for longer than MAX_RETRY_AFTER_MS.
+ */
+function retryAfterMs(response: Response): number | null {
+  const header = response.headers?.get("retry-after");
+  if (!header) return null;
+  const seconds = Number(header);
+  if (!Number.isFinite(seconds) || seconds < 0) return null;
+  const ms = seconds * 1000;
+  return ms <= MAX_RETRY_AFTER_MS ? ms : null;
+}
+
 async function giteaFetch<T>(
   host: string | null | undefined,
   path: string,
@@ -72,9 +90,24 @@ async function giteaFetch<T>(
     init.body = JSON.stringify(options.body);
   }
 
-  const response = await fetch(url, init);
+  for (let attempt = 0; ; attempt++) {
+    const response = await fetch(url, init);
+
+    if (response.ok) {
+      return (await response.json()) as T;
+    }
+
+    // Honor a short Retry-After once before giving up; comment pagination in
+    // particular can trip Gitea's per-minute limit mid-run.
+    if (response.status === 429 && attempt === 0) {
+      const delay = retryAfterMs(response);
+      if (delay !== null) {
+        logger.warn(`Rate limited by Gitea API; retrying in ${Math.ceil(delay / 1000)}s`);
+        await new Promise((resolve) => setTimeout(resolve, delay));
+        continue;
+      }
+    }
 
-  if (!response.ok) {
     const text = await response.text().catch(() => "");
     if (response.status === 401 || response.status === 403) {
       throw new GiteaAPIError(
@@ -88,8 +121,6 @@ async function giteaFetch<T>(
       `Gitea API error ${response.status} for ${options?.method ?? "GET"} ${path}: ${text}`,
     );
   }
-
-  return (await response.json()) as T;
 }
 
 /**
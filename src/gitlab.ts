@@ -99,6 +99,20 @@ export class GitLabAPIError extends Error {
   }
 }
 
+/** Normalize an unknown thrown value to its message string. */
+function errorMessage(err: unknown): string {
+  return err instanceof Error ? err.message : String(err);
+}
+
+/**
+ * Translate a failed glab call into a GitLabAPIError with a consistent
+ * `<context>: <message>` shape — every catch block below used to hand-roll
+ * this same pair of lines.
+ */
+function gitlabApiError(context: string, err: unknown): GitLabAPIError {
+  return new GitLabAPIError(`${context}: ${errorMessage(err)}`);
+}
+
 function normalizeBaseUrl(host?: string | null): string {
   const candidate =
     host ||
@@ -112,22 +126,50 @@ function normalizeBaseUrl(host?: string | null): string {
   return `https://${trimmed}`.replace(/\/+$/, "");
 }
 
+// Every API helper URL-encodes the same owner/repo pair, often dozens of
+// times per review; the encoding is pure, so compute it once per project.
+const encodedProjectPathCache = new Map<string, string>();
+
 function encodedProjectPath(owner: string, repo: string): string {
+  const key = `${owner}/${repo}`;
+  const cached = encodedProjectPathCache.get(key);
+  if (cached !== undefined) return cached;
+
   const projectPath = [owner.replace(/^\/+|\/+$/g, ""), repo.replace(/^\/+|\/+$/g, "")]
     .filter(Boolean)
     .join("/");
-  return encodeURIComponent(projectPath);
+  const encoded = encodeURIComponent(projectPath);
+  encodedProjectPathCache.set(key, encoded);
+  return encoded;
 }
 
+// Every glab invocation needs a process.env copy with GITLAB_HOST pinned.
+// Re-spreading the environment and re-resolving the host on each of the many
+// API calls in a review session is redundant — the result is invariant for a
+// given `host` argument — so snapshots are cached per host.
+const glabEnvCache = new Map<string, NodeJS.ProcessEnv>();
+
 function glabEnv(host?: string | null): NodeJS.ProcessEnv {
+  const key = host ?? "";
+  const cached = glabEnvCache.get(key);
+  if (cached) return cached;
+
   const env = { ...process.env };
   // Ensure glab knows which host to talk to
   const baseUrl = normalizeBaseUrl(host);
   const hostname = baseUrl.replace(/^https?:\/\//, "");
   env.GITLAB_HOST = hostname;
+  glabEnvCache.set(key, env);
   return env;
 }
 
+// A single review fetches the same MR payload twice: workspace setup resolves
+// the source/target branches, then the orchestrator rebuilds prompt context.
+// Cache the raw GET briefly so the second call skips a glab round-trip. Notes
+// are never cached — they are fetched per call when requested.
+const MR_INFO_TTL_MS = 60 * 1000;
+const mrInfoCache = new Map<string, { expires: number; data: Record<string, unknown> }>();
+
 /**
  * Fetch merge request metadata using glab api.
  */
@@ -141,16 +183,23 @@ export async function fetchGitlabMrInfo(
   const encoded = encodedProjectPath(owner, repo);
   const env = glabEnv(host);
 
+  const cacheKey = `${host ?? ""}:${encoded}:${mrNumber}`;
+  const cached = mrInfoCache.get(cacheKey);
+
   let mrData: Record<string, unknown>;
-  try {
-    mrData = await execJson<Record<string, unknown>>(
-      "glab",
-      ["api", `projects/${encoded}/merge_requests/${mrNumber}`],
-      { env },
-    );
-  } catch (err) {
-    const msg = err instanceof Error ? err.message : String(err);
-    throw new GitLabAPIError(`Failed to fetch MR !${mrNumber}: ${msg}`);
+  if (cached && cached.expires > Date.now()) {
+    mrData = cached.data;
+  } else {
+    try {
+      mrData = await execJson<Record<string, unknown>>(
+        "glab",
+        ["api", `projects/${encoded}/merge_requests/${mrNumber}`],
+        { env },
+      );
+    } catch (err) {
+      throw gitlabApiError(`Failed to fetch MR !${mrNumber}`, err);
+    }
+    mrInfoCache.set(cacheKey, { expires: Date.now() + MR_INFO_TTL_MS, data: mrData });
   }
 
   const metadata: MrMetadata = {
@@ -170,18 +219,27 @@ export async function fetchGitlabMrInfo(
       // glab --paginate concatenates JSON arrays across pages (e.g., `[...][...]`).
       // Parse each top-level array separately and merge, avoiding regex on raw JSON
       // which could corrupt string values containing `][`.
+      // per_page=100 (the API maximum) keeps --paginate to a fifth of the
+      // round-trips the default 20-per-page would need on busy MRs.
       const { stdout: rawNotes } = await exec(
         "glab",
-        ["api", `projects/${encoded}/merge_requests/${mrNumber}/notes`, "--paginate"],
+        ["api", `projects/${encoded}/merge_requests/${mrNumber}/notes?per_page=100`, "--paginate"],
         { env },
       );
       const notes = parseGlabPaginatedJson(rawNotes);
-      metadata.Notes = notes.map((n) => ({
-        body: (n.body as string) ?? "",
-        author: n.author as { username?: string; name?: string } | undefined,
-        created_at: n.created_at as string | undefined,
-        system: n.system as boolean | undefined,
-      }));
+      // System notes (label/assignee/commit churn — often the bulk of a busy
+      // MR's notes) are discarded by every downstream consumer: the notes
+      // summary skips them and the previous-review-SHA scan only matches
+      // hodor's own (non-system) comments. Filter them here so they never
+      // materialize into NoteEntry objects at all.
+      metadata.Notes = notes
+        .filter((n) => n.system !== true)
+        .map((n) => ({
+          body: (n.body as string) ?? "",
+          author: n.author as { username?: string; name?: string } | undefined,
+          created_at: n.created_at as string | undefined,
+          system: n.system as boolean | undefined,
+        }));
     } catch (err) {
       logger.warn(`Failed to fetch MR notes: ${err instanceof Error ? err.message : err}`);
     }
@@ -219,8 +277,48 @@ export async function postGitlabMrComment(
       { env, input: JSON.stringify({ body }) },
     );
   } catch (err) {
-    const msg = err instanceof Error ? err.message : String(err);
-    throw new GitLabAPIError(`Failed to post comment to MR !${mrNumber}: ${msg}`);
+    throw gitlabApiError(`Failed to post comment to MR !${mrNumber}`, err);
+  }
+}
+
+// Boilerplate acknowledgements that add nothing to review context. Compiled
+// once into a single case-insensitive alternation so each note costs one regex
+// scan instead of a per-pattern substring loop over a lowercased copy.
+const TRIVIAL_NOTE_PATTERNS = [
+  "lgtm",
+  "+1",
+  "-1",
+  "👍",
+  "👎",
+  "thanks",
+  "thank you",
+  "looks good",
+  "approved",
+  "🚀",
+  "✅",
+  "❌",
+];
+
+const TRIVIAL_NOTE_RE = new RegExp(
+  TRIVIAL_NOTE_PATTERNS.map((p) => p.replace(/[.*+?^${}()|[\]\\]/g, "\\$&")).join("|"),
+  "i",
+);
+
+/**
+ * Render a note timestamp as "YYYY-MM-DD HH:MM". The output is a fixed prefix
+ * of the ISO string, so a UTC timestamp is sliced directly — no Date
+ * construction, no toISOString round-trip. Offset timestamps still go through
+ * Date so the rendered time stays UTC.
+ */
+function formatNoteTimestamp(createdAt: string): string {
+  if (!createdAt) return "";
+  if (createdAt.length >= 16 && createdAt[10] === "T" && createdAt.endsWith("Z")) {
+    return `${createdAt.slice(0, 10)} ${createdAt.slice(11, 16)}`;
+  }
+  try {
+    return new Date(createdAt).toISOString().replace("T", " ").slice(0, 16);
+  } catch {
+    return createdAt.slice(0, 10);
   }
 }
 
@@ -233,21 +331,6 @@ export function summarizeGitlabNotes(
 ): string {
   if (!notes || notes.length === 0) return "";
 
-  const trivialPatterns = new Set([
-    "lgtm",
-    "+1",
-    "-1",
-    "👍",
-    "👎",
-    "thanks",
-    "thank you",
-    "looks good",
-    "approved",
-    "🚀",
-    "✅",
-    "❌",
-  ]);
-
   const filtered: Array<{ username: string; body: string; createdAt: string }> = [];
   for (const note of notes) {
     const body = (note.body ?? "").trim();
@@ -255,39 +338,36 @@ export function summarizeGitlabNotes(
     if (note.system) continue;
     if (body.length < 20) continue;
 
-    const bodyLower = body.toLowerCase();
-    let isTrivial = false;
-    for (const pattern of trivialPatterns) {
-      if (bodyLower.includes(pattern) && body.length < 50) {
-        isTrivial = true;
-        break;
-      }
-    }
-    if (isTrivial) continue;
+    // Length gate first: only short comments can be trivial, so long bodies
+    // skip the regex scan entirely.
+    if (body.length < 50 && TRIVIAL_NOTE_RE.test(body)) continue;
 
     const username =
       note.author?.username ?? note.author?.name ?? "unknown";
     filtered.push({ username, body, createdAt: note.created_at ?? "" });
   }
 
-  // Sort oldest first
-  filtered.sort((a, b) => a.createdAt.localeCompare(b.createdAt));
-
-  // Take most recent
-  const recent = filtered.slice(-maxEntries);
+  // Select the maxEntries most recent notes (kept oldest-first) without
+  // sorting the whole list: insert each note into a small ascending window and
+  // evict the oldest on overflow — O(N·k) with k ≤ 5 beats O(N log N) on MRs
+  // with hundreds of notes.
+  const recent: typeof filtered = [];
+  for (const entry of filtered) {
+    if (
+      recent.length === maxEntries &&
+      entry.createdAt.localeCompare(recent[0].createdAt) < 0
+    ) {
+      continue;
+    }
+    let i = recent.length;
+    while (i > 0 && recent[i - 1].createdAt.localeCompare(entry.createdAt) > 0) i--;
+    recent.splice(i, 0, entry);
+    if (recent.length > maxEntries) recent.shift();
+  }
 
   const lines: string[] = [];
   for (const { username, body, createdAt } of recent) {
-    let timestampStr = "";
-    if (createdAt) {
-      try {
-        const dt = new Date(createdAt);
-        timestampStr = dt.toISOString().replace("T", " ").slice(0, 16);
-      } catch {
-        timestampStr = createdAt.slice(0, 10);
-      }
-    }
-
+    const timestampStr = formatNoteTimestamp(createdAt);
     const header = timestampStr
       ? `- ${timestampStr} @${username}:`
       : `- @${username}:`;
@@ -318,6 +398,33 @@ export async function getGitlabMrDiffRefs(
   const encoded = encodedProjectPath(owner, repo);
   const env = glabEnv(host);
 
+  // The latest diff version carries the same three SHAs as the MR's
+  // diff_refs but the `/versions` payload is a few hundred bytes, versus the
+  // full MR object (description, pipeline, participants, ...). Fall back to
+  // the MR GET for older instances or odd payloads.
+  try {
+    const versions = await execJson<Array<Record<string, unknown>>>(
+      "glab",
+      ["api", `projects/${encoded}/merge_requests/${mrNumber}/versions?per_page=1`],
+      { env },
+    );
+    const latest = Array.isArray(versions) ? versions[0] : undefined;
+    const base_sha = latest?.base_commit_sha;
+    const head_sha = latest?.head_commit_sha;
+    const start_sha = latest?.start_commit_sha;
+    if (
+      typeof base_sha === "string" && base_sha &&
+      typeof head_sha === "string" && head_sha &&
+      typeof start_sha === "string" && start_sha
+    ) {
+      return { base_sha, head_sha, start_sha };
+    }
+  } catch (err) {
+    logger.debug(
+      `MR versions lookup failed, falling back to full MR fetch: ${err instanceof Error ? err.message : err}`,
+    );
+  }
+
   let mrData: Record<string, unknown>;
   try {
     mrData = await execJson<Record<string, unknown>>(
@@ -326,8 +433,7 @@ export async function getGitlabMrDiffRefs(
       { env },
     );
   } catch (err) {
-    const msg = err instanceof Error ? err.message : String(err);
-    throw new GitLabAPIError(`Failed to fetch diff refs for MR !${mrNumber}: ${msg}`);
+    throw gitlabApiError(`Failed to fetch diff refs for MR !${mrNumber}`, err);
   }
 
   const diffRefs = mrData.diff_refs as Record<string, unknown> | undefined;
@@ -386,7 +492,7 @@ export async function postGitlabInlineComment(
       },
     );
   } catch (err) {
-    const msg = err instanceof Error ? err.message : String(err);
+    const msg = errorMessage(err);
     if (isPositionErrorMessage(msg)) {
       logger.warn(`Skipping inline comment for ${filePath}:${line}: ${msg}`);
       return null;
@@ -448,6 +554,52 @@ export function parseDiffNewLineMap(diff: string): Map<number, DiffLinePosition>
   return map;
 }
 
+// The unified diff embedded in the prompt and the line map used to position
+// inline notes both paginate the same /diffs endpoint for the same MR within
+// one review. Cache the concatenated pages briefly so the payload — often the
+// largest transfer of the run — crosses the wire once.
+const DIFF_PAGES_TTL_MS = 60 * 1000;
+const diffPagesCache = new Map<
+  string,
+  { expires: number; pages: Array<Record<string, unknown>> }
+>();
+
+/** Reset the /diffs page cache (test isolation). */
+export function clearGitlabDiffCache(): void {
+  diffPagesCache.clear();
+}
+
+/** Fetch every page of an MR's /diffs endpoint, serving repeats from cache. */
+async function fetchMrDiffPages(
+  owner: string,
+  repo: string,
+  mrNumber: number | string,
+  host?: string | null,
+): Promise<Array<Record<string, unknown>>> {
+  const encoded = encodedProjectPath(owner, repo);
+  const cacheKey = `${host ?? ""}:${encoded}:${mrNumber}`;
+  const cached = diffPagesCache.get(cacheKey);
+  if (cached && cached.expires > Date.now()) return cached.pages;
+
+  const env = glabEnv(host);
+  const all: Array<Record<string, unknown>> = [];
+  // /diffs is paginated; pull enough pages to cover large MRs. per_page=100
+  // (the API maximum, same as the notes fetch) halves the round-trips the
+  // previous 50-per-page needed on big MRs.
+  for (let page = 1; page <= 20; page++) {
+    const changes = await execJson<Array<Record<string, unknown>>>(
+      "glab",
+      ["api", `projects/${encoded}/merge_requests/${mrNumber}/diffs?per_page=100&page=${page}`],
+      { env },
+    );
+    if (!Array.isArray(changes) || changes.length === 0) break;
+    all.push(...changes);
+    if (changes.length < 100) break;
+  }
+  diffPagesCache.set(cacheKey, { expires: Date.now() + DIFF_PAGES_TTL_MS, pages: all });
+  return all;
+}
+
 /**
  * Fetch an MR's diffs and build a per-file map of new-line -> position info,
  * used to position inline notes correctly (see parseDiffNewLineMap). Keyed by
@@ -460,26 +612,15 @@ export async function getGitlabMrDiffLineMap(
   mrNumber: number | string,
   host?: string | null,
 ): Promise<Map<string, Map<number, DiffLinePosition>>> {
-  const encoded = encodedProjectPath(owner, repo);
-  const env = glabEnv(host);
   const result = new Map<string, Map<number, DiffLinePosition>>();
   try {
-    // /diffs is paginated; pull enough pages to cover large MRs.
-    for (let page = 1; page <= 20; page++) {
-      const changes = await execJson<Array<Record<string, unknown>>>(
-        "glab",
-        ["api", `projects/${encoded}/merge_requests/${mrNumber}/diffs?per_page=50&page=${page}`],
-        { env },
-      );
-      if (!Array.isArray(changes) || changes.length === 0) break;
-      for (const change of changes) {
-        const newPath = change.new_path as string | undefined;
-        const diff = change.diff as string | undefined;
-        if (newPath && typeof diff === "string") {
-          result.set(newPath, parseDiffNewLineMap(diff));
-        }
+    const changes = await fetchMrDiffPages(owner, repo, mrNumber, host);
+    for (const change of changes) {
+      const newPath = change.new_path as string | undefined;
+      const diff = change.diff as string | undefined;
+      if (newPath && typeof diff === "string") {
+        result.set(newPath, parseDiffNewLineMap(diff));
       }
-      if (changes.length < 50) break;
     }
   } catch (err) {
     logger.warn(`Failed to fetch MR diff line map: ${err instanceof Error ? err.message : err}`);
@@ -541,28 +682,18 @@ export async function getGitlabMrUnifiedDiff(
   mrNumber: number | string,
   host?: string | null,
 ): Promise<GitlabMrDiff | null> {
-  const encoded = encodedProjectPath(owner, repo);
-  const env = glabEnv(host);
   const files = new Set<string>();
   const tooLargeFiles = new Set<string>();
   const sections: string[] = [];
   try {
-    for (let page = 1; page <= 20; page++) {
-      const changes = await execJson<Array<Record<string, unknown>>>(
-        "glab",
-        ["api", `projects/${encoded}/merge_requests/${mrNumber}/diffs?per_page=50&page=${page}`],
-        { env },
-      );
-      if (!Array.isArray(changes) || changes.length === 0) break;
-      for (const change of changes) {
-        const oldPath = typeof change.old_path === "string" ? change.old_path : undefined;
-        const newPath = typeof change.new_path === "string" ? change.new_path : undefined;
-        if (oldPath) files.add(oldPath);
-        if (newPath) files.add(newPath);
-        if (change.too_large === true) tooLargeFiles.add(newPath ?? oldPath ?? "");
-        sections.push(reconstructGitDiffSection(change, oldPath, newPath));
-      }
-      if (changes.length < 50) break;
+    const changes = await fetchMrDiffPages(owner, repo, mrNumber, host);
+    for (const change of changes) {
+      const oldPath = typeof change.old_path === "string" ? change.old_path : undefined;
+      const newPath = typeof change.new_path === "string" ? change.new_path : undefined;
+      if (oldPath) files.add(oldPath);
+      if (newPath) files.add(newPath);
+      if (change.too_large === true) tooLargeFiles.add(newPath ?? oldPath ?? "");
+      sections.push(reconstructGitDiffSection(change, oldPath, newPath));
     }
     tooLargeFiles.delete("");
     return { diff: sections.join(""), files: [...files], tooLargeFiles: [...tooLargeFiles] };
@@ -615,8 +746,7 @@ export async function createGitlabDraftNote(
       },
     );
   } catch (err) {
-    const msg = err instanceof Error ? err.message : String(err);
-    throw new GitLabAPIError(`Failed to create draft note for MR !${mrNumber}: ${msg}`);
+    throw gitlabApiError(`Failed to create draft note for MR !${mrNumber}`, err);
   }
 }
 
@@ -641,8 +771,7 @@ export async function bulkPublishGitlabDraftNotes(
       { env },
     );
   } catch (err) {
-    const msg = err instanceof Error ? err.message : String(err);
-    throw new GitLabAPIError(`Failed to bulk publish draft notes for MR !${mrNumber}: ${msg}`);
+    throw gitlabApiError(`Failed to bulk publish draft notes for MR !${mrNumber}`, err);
   }
 }
 
@@ -677,9 +806,7 @@ export async function publishGitlabDraftNotesResilient(
       { env },
     );
   } catch (err) {
-    throw new GitLabAPIError(
-      `Failed to list draft notes for MR !${mrNumber}: ${err instanceof Error ? err.message : err}`,
-    );
+    throw gitlabApiError(`Failed to list draft notes for MR !${mrNumber}`, err);
   }
 
   let published = 0;
@@ -748,8 +875,7 @@ export async function postGitlabCommitStatus(
       },
     );
   } catch (err) {
-    const msg = err instanceof Error ? err.message : String(err);
-    throw new GitLabAPIError(`Failed to post commit status for ${sha}: ${msg}`);
+    throw gitlabApiError(`Failed to post commit status for ${sha}`, err);
   }
 }
 
@@ -776,8 +902,7 @@ export async function cleanupHodorComments(
     );
     notes = parseGlabPaginatedJson(rawNotes);
   } catch (err) {
-    const msg = err instanceof Error ? err.message : String(err);
-    throw new GitLabAPIError(`Failed to list notes for MR !${mrNumber}: ${msg}`);
+    throw gitlabApiError(`Failed to list notes for MR !${mrNumber}`, err);
   }
 
   const matchedNotes = notes.filter((note) => isHodorNote(note.body, marker));
@@ -802,10 +927,9 @@ export async function cleanupHodorComments(
       deletedCount += 1;
       logger.debug(`Deleted GitLab MR note ${noteId}`);
     } catch (err) {
-      const msg = err instanceof Error ? err.message : String(err);
       // Inline (discussion) notes can't be deleted via /notes/{id}; log and continue
       // so one stale note doesn't abort the whole cleanup.
-      logger.warn(`Skipping note ${noteId} on MR !${mrNumber}: ${msg}`);
+      logger.warn(`Skipping note ${noteId} on MR !${mrNumber}: ${errorMessage(err)}`);
       failedCount += 1;
     }
   }
@@ -817,26 +941,21 @@ export async function cleanupHodorComments(
   return deletedCount;
 }
 
-export async function listHodorDiscussions(
+/**
+ * Fetch every discussion on an MR (paginated). Both listHodorDiscussions and
+ * listAllMrNotes consume this payload; callers that need both views should
+ * fetch once and pass the result in, halving the paginated round-trips per
+ * posting operation.
+ */
+export async function fetchGitlabMrDiscussions(
   owner: string,
   repo: string,
   mrNumber: number | string,
   host?: string | null,
-  marker = HODOR_REVIEW_MARKER,
-): Promise<
-  Array<{
-    discussionId: string;
-    noteId: number;
-    body: string;
-    resolved: boolean;
-    filePath?: string;
-    line?: number;
-  }>
-> {
+): Promise<Array<Record<string, unknown>>> {
   const encoded = encodedProjectPath(owner, repo);
   const env = glabEnv(host);
 
-  let discussions: Array<Record<string, unknown>>;
   try {
     const { stdout: rawDiscussions } = await exec(
       "glab",
@@ -847,11 +966,31 @@ export async function listHodorDiscussions(
       ],
       { env },
     );
-    discussions = parseGlabPaginatedJson(rawDiscussions);
+    return parseGlabPaginatedJson(rawDiscussions);
   } catch (err) {
-    const msg = err instanceof Error ? err.message : String(err);
-    throw new GitLabAPIError(`Failed to list discussions for MR !${mrNumber}: ${msg}`);
+    throw gitlabApiError(`Failed to list discussions for MR !${mrNumber}`, err);
   }
+}
+
+export async function listHodorDiscussions(
+  owner: string,
+  repo: string,
+  mrNumber: number | string,
+  host?: string | null,
+  marker = HODOR_REVIEW_MARKER,
+  prefetchedDiscussions?: Array<Record<string, unknown>>,
+): Promise<
+  Array<{
+    discussionId: string;
+    noteId: number;
+    body: string;
+    resolved: boolean;
+    filePath?: string;
+    line?: number;
+  }>
+> {
+  const discussions =
+    prefetchedDiscussions ?? (await fetchGitlabMrDiscussions(owner, repo, mrNumber, host));
 
   const results: Array<{
     discussionId: string;
@@ -925,26 +1064,10 @@ export async function listAllMrNotes(
   repo: string,
   mrNumber: number | string,
   host?: string | null,
+  prefetchedDiscussions?: Array<Record<string, unknown>>,
 ): Promise<Array<{ filePath?: string; line?: number; body: string }>> {
-  const encoded = encodedProjectPath(owner, repo);
-  const env = glabEnv(host);
-
-  let discussions: Array<Record<string, unknown>>;
-  try {
-    const { stdout: rawDiscussions } = await exec(
-      "glab",
-      [
-        "api",
-        `projects/${encoded}/merge_requests/${mrNumber}/discussions?per_page=100`,
-        "--paginate",
-      ],
-      { env },
-    );
-    discussions = parseGlabPaginatedJson(rawDiscussions);
-  } catch (err) {
-    const msg = err instanceof Error ? err.message : String(err);
-    throw new GitLabAPIError(`Failed to list discussions for MR !${mrNumber}: ${msg}`);
-  }
+  const discussions =
+    prefetchedDiscussions ?? (await fetchGitlabMrDiscussions(owner, repo, mrNumber, host));
 
   const results: Array<{ filePath?: string; line?: number; body: string }> = [];
 
@@ -1005,8 +1128,7 @@ export async function resolveGitlabDiscussions(
       );
       resolvedCount += 1;
     } catch (err) {
-      const msg = err instanceof Error ? err.message : String(err);
-      logger.warn(`Failed to resolve discussion ${discussionId} on MR !${mrNumber}: ${msg}`);
+      logger.warn(`Failed to resolve discussion ${discussionId} on MR !${mrNumber}: ${errorMessage(err)}`);
     }
   }
 
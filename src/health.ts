@@ -1,5 +1,6 @@
-import { statfsSync } from "node:fs";
+import { accessSync, constants, statfsSync } from "node:fs";
 import { tmpdir } from "node:os";
+import { delimiter, join } from "node:path";
 import { exec } from "./utils/exec.js";
 import type { Platform } from "./types.js";
 
@@ -26,13 +27,16 @@ export function warningChecks(report: HealthReport): HealthCheckResult[] {
   return report.checks.filter((c) => !c.required && !c.passed);
 }
 
+// Built once; formatHealthReport previously re-allocated it twice per render.
+const REPORT_SEPARATOR = "=".repeat(40);
+
 export function formatHealthReport(report: HealthReport): string {
-  const lines = ["Health Check Report", "=".repeat(40)];
+  const lines = ["Health Check Report", REPORT_SEPARATOR];
   for (const check of report.checks) {
     const status = check.passed ? "PASS" : check.required ? "FAIL" : "WARN";
     lines.push(`[${status}] ${check.name}: ${check.message}`);
   }
-  lines.push("=".repeat(40));
+  lines.push(REPORT_SEPARATOR);
   if (allChecksPassed(report)) {
     lines.push("All required checks passed!");
   } else {
@@ -41,6 +45,26 @@ export function formatHealthReport(report: HealthReport): string {
   return lines.join("\n");
 }
 
+/**
+ * Pure PATH walk (à la `which`): a missing binary is decided in microseconds
+ * instead of paying a full process spawn just to hit ENOENT. Skipped on
+ * Windows, where executable resolution goes through PATHEXT — there we fall
+ * through to the spawn and let the OS decide.
+ */
+function isCommandOnPath(cmd: string): boolean {
+  if (process.platform === "win32") return true;
+  for (const dir of (process.env.PATH ?? "").split(delimiter)) {
+    if (!dir) continue;
+    try {
+      accessSync(join(dir, cmd), constants.X_OK);
+      return true;
+    } catch {
+      // Not in this directory; keep scanning.
+    }
+  }
+  return false;
+}
+
 async function checkCliVersion(
   name: string,
   cmd: string,
@@ -48,6 +72,14 @@ async function checkCliVersion(
   opts: { required?: boolean; installHint?: string } = {},
 ): Promise<HealthCheckResult> {
   const required = opts.required ?? true;
+  if (!isCommandOnPath(cmd)) {
+    return {
+      name,
+      passed: false,
+      message: `${cmd} not found in PATH${opts.installHint ? `. ${opts.installHint}` : ""}`,
+      required,
+    };
+  }
   try {
     const { stdout } = await exec(cmd, args);
     const versionLine = stdout.trim().split("\n")[0] || "unknown version";
@@ -61,19 +93,44 @@ async function checkCliVersion(
   }
 }
 
+// CLI availability is invariant for the process lifetime, so each probe's
+// subprocess runs at most once even when health checks run repeatedly (e.g. a
+// per-PR review loop). Results are copied on the way out because
+// runHealthChecks mutates `required` on platform-specific checks.
+const cliCheckCache = new Map<string, Promise<HealthCheckResult>>();
+
+/** Reset the memoized CLI availability probes (used by tests). */
+export function clearHealthCheckCache(): void {
+  cliCheckCache.clear();
+}
+
+async function cachedCliVersion(
+  name: string,
+  cmd: string,
+  args: string[],
+  opts: { required?: boolean; installHint?: string } = {},
+): Promise<HealthCheckResult> {
+  let pending = cliCheckCache.get(cmd);
+  if (!pending) {
+    pending = checkCliVersion(name, cmd, args, opts);
+    cliCheckCache.set(cmd, pending);
+  }
+  return { ...(await pending) };
+}
+
 export function checkGitAvailable(): Promise<HealthCheckResult> {
-  return checkCliVersion("Git", "git", ["--version"]);
+  return cachedCliVersion("Git", "git", ["--version"]);
 }
 
 export function checkGhCliAvailable(): Promise<HealthCheckResult> {
-  return checkCliVersion("GitHub CLI (gh)", "gh", ["--version"], {
+  return cachedCliVersion("GitHub CLI (gh)", "gh", ["--version"], {
     required: false,
     installHint: "Install from https://cli.github.com",
   });
 }
 
 export function checkGlabCliAvailable(): Promise<HealthCheckResult> {
-  return checkCliVersion("GitLab CLI (glab)", "glab", ["--version"], {
+  return cachedCliVersion("GitLab CLI (glab)", "glab", ["--version"], {
     required: false,
     installHint: "Install from https://gitlab.com/gitlab-org/cli",
   });
@@ -175,31 +232,44 @@ export async function runHealthChecks(opts: { platform?: Platform; skipOptional?
   const { platform, skipOptional = false } = opts;
   const checks: HealthCheckResult[] = [];
 
+  // Only probe what the report will actually include: with skipOptional set,
+  // the other platform's checks are never pushed below, so spawning gh (whose
+  // `gh auth status` fallback dominates the token-check cost) or glab for them
+  // is pure waste.
+  const needsGithubChecks = platform === "github" || platform === "gitea" || !skipOptional;
+  const needsGitlabChecks = platform === "gitlab" || !skipOptional;
+
+  // The CLI/auth probes each spawn a subprocess and are independent of one
+  // another — run them concurrently instead of stacking their spawn latencies.
+  const [gitCheck, ghCheck, glabCheck, githubTokenCheck] = await Promise.all([
+    checkGitAvailable(),
+    needsGithubChecks ? checkGhCliAvailable() : null,
+    needsGitlabChecks ? checkGlabCliAvailable() : null,
+    needsGithubChecks ? checkGithubToken() : null,
+  ]);
+
   // Core checks (always run)
   checks.push(checkNodeVersion());
-  checks.push(await checkGitAvailable());
+  checks.push(gitCheck);
   checks.push(checkLlmApiKey());
 
   if (!skipOptional) {
     checks.push(checkDiskSpace());
   }
 
-  const ghCheck = await checkGhCliAvailable();
-  const glabCheck = await checkGlabCliAvailable();
-  const githubTokenCheck = await checkGithubToken();
-  const gitlabTokenCheck = checkGitlabToken();
+  const gitlabTokenCheck = needsGitlabChecks ? checkGitlabToken() : null;
 
   // Mark platform-specific checks as required if the platform is known
-  if (platform === "github" || platform === "gitea") {
+  if ((platform === "github" || platform === "gitea") && ghCheck && githubTokenCheck) {
     ghCheck.required = true;
     githubTokenCheck.required = true;
     checks.push(ghCheck, githubTokenCheck);
-    if (!skipOptional) checks.push(glabCheck, gitlabTokenCheck);
-  } else if (platform === "gitlab") {
+    if (!skipOptional && glabCheck && gitlabTokenCheck) checks.push(glabCheck, gitlabTokenCheck);
+  } else if (platform === "gitlab" && glabCheck && gitlabTokenCheck) {
     gitlabTokenCheck.required = true;
     checks.push(glabCheck, gitlabTokenCheck);
-    if (!skipOptional) checks.push(ghCheck, githubTokenCheck);
-  } else if (!skipOptional) {
+    if (!skipOptional && ghCheck && githubTokenCheck) checks.push(ghCheck, githubTokenCheck);
+  } else if (!skipOptional && ghCheck && githubTokenCheck && glabCheck && gitlabTokenCheck) {
     checks.push(ghCheck, githubTokenCheck, glabCheck, gitlabTokenCheck);
   }
 
@@ -26,21 +26,34 @@ export interface JiraIssue {
   };
 }
 
+// The auth header is derived purely from the env credentials, so the base64
+// encoding is computed once per credential pair instead of on every fetch.
+// Keying on the raw pair keeps the cache correct if the env changes mid-process.
+let cachedJiraAuth: { credentials: string; header: Record<string, string> } | null = null;
+
 function getJiraAuthHeader(): Record<string, string> | null {
   const email = process.env.JIRA_EMAIL;
   const apiKey = process.env.JIRA_API_KEY;
   if (!email || !apiKey) return null;
 
-  const encoded = Buffer.from(`${email}:${apiKey}`, "utf-8").toString("base64");
-  return {
+  const credentials = `${email}:${apiKey}`;
+  if (cachedJiraAuth?.credentials === credentials) return cachedJiraAuth.header;
+
+  const encoded = Buffer.from(credentials, "utf-8").toString("base64");
+  const header = {
     Authorization: `Basic ${encoded}`,
     "Content-Type": "application/json",
   };
+  cachedJiraAuth = { credentials, header };
+  return header;
 }
 
 /** Extract Jira issue URLs from text, deduplicated and normalized to uppercase keys. */
 export function extractJiraUrls(text: string | null | undefined): JiraUrlMatch[] {
   if (!text) return [];
+  // Cheap substring guard: most MRs have no Jira link at all, and a plain
+  // indexOf scan is far cheaper than running the regex over a long description.
+  if (!text.includes("atlassian.net")) return [];
 
   const seen = new Set<string>();
   const result: JiraUrlMatch[] = [];
@@ -56,6 +69,20 @@ export function extractJiraUrls(text: string | null | undefined): JiraUrlMatch[]
   return result;
 }
 
+// Within a run the same issue key can be fetched more than once — e.g. a
+// linked subtask whose parent is itself linked elsewhere in the MR. Cache
+// fetched issues briefly so each key costs at most one round-trip. Failed
+// fetches are not cached so transient errors retry naturally. Entries keep the
+// response ETag past their TTL: a refresh sends If-None-Match, and a 304 turns
+// the re-fetch into a near-empty response instead of a full payload.
+const ISSUE_CACHE_TTL_MS = 10 * 60 * 1000;
+const issueCache = new Map<string, { expires: number; etag?: string; issue: JiraIssue }>();
+
+/** Reset the fetched-issue cache (used by tests). */
+export function clearJiraIssueCache(): void {
+  issueCache.clear();
+}
+
 /** Fetch Jira issue details via REST API. Returns null if credentials are missing or the fetch fails. */
 export async function fetchJiraIssue(host: string, issueKey: string): Promise<JiraIssue | null> {
   const authHeader = getJiraAuthHeader();
@@ -64,23 +91,112 @@ export async function fetchJiraIssue(host: string, issueKey: string): Promise<Ji
     return null;
   }
 
-  const url = `https://${host}/rest/api/3/issue/${issueKey}`;
+  const cacheKey = `${host}:${issueKey}`;
+  const cached = issueCache.get(cacheKey);
+  if (cached && cached.expires > Date.now()) return cached.issue;
+
+  // Only request the fields the summarizer reads — the full representation
+  // (every custom field plus rendered HTML) can run to hundreds of KB.
+  const url = `https://${host}/rest/api/3/issue/${issueKey}?fields=${JIRA_ISSUE_FIELDS.join(",")}`;
+  const headers = cached?.etag
+    ? { ...authHeader, "If-None-Match": cached.etag }
+    : authHeader;
   try {
     const response = await fetch(url, {
-      headers: authHeader,
+      headers,
       signal: AbortSignal.timeout(10_000),
     });
+    if (response.status === 304 && cached) {
+      cached.expires = Date.now() + ISSUE_CACHE_TTL_MS;
+      return cached.issue;
+    }
     if (!response.ok) {
       logger.warn(`Failed to fetch Jira issue ${issueKey}: HTTP ${response.status}`);
       return null;
     }
-    return (await response.json()) as JiraIssue;
+    const issue = (await response.json()) as JiraIssue;
+    issueCache.set(cacheKey, {
+      expires: Date.now() + ISSUE_CACHE_TTL_MS,
+      etag: response.headers.get("etag") ?? undefined,
+      issue,
+    });
+    return issue;
   } catch (err) {
     logger.warn(`Failed to fetch Jira issue ${issueKey}: ${err instanceof Error ? err.message : err}`);
     return null;
   }
 }
 
+// The only fields the summarizer consumes; also the `fields` list sent to the
+// bulk search endpoint so responses stay lean.
+const JIRA_ISSUE_FIELDS = ["summary", "issuetype", "status", "priority", "description", "parent"];
+
+/**
+ * Fetch several issues from one host in a single `/search` call
+ * (`jql=key in (...)`) instead of one GET per key. A single key takes the
+ * per-issue GET path — same round-trip count, and it shares the issue cache.
+ * Returns whatever could be fetched, keyed by issue key.
+ */
+export async function fetchJiraIssuesBulk(
+  host: string,
+  keys: string[],
+): Promise<Map<string, JiraIssue>> {
+  const results = new Map<string, JiraIssue>();
+  if (keys.length === 0) return results;
+  if (keys.length === 1) {
+    const issue = await fetchJiraIssue(host, keys[0]);
+    if (issue) results.set(keys[0], issue);
+    return results;
+  }
+
+  const authHeader = getJiraAuthHeader();
+  if (!authHeader) {
+    logger.warn("Jira credentials not configured (JIRA_EMAIL, JIRA_API_KEY)");
+    return results;
+  }
+
+  const url = `https://${host}/rest/api/3/search`;
+  try {
+    const response = await fetch(url, {
+      method: "POST",
+      headers: authHeader,
+      body: JSON.stringify({
+        jql: `key in (${keys.join(",")})`,
+        fields: JIRA_ISSUE_FIELDS,
+        maxResults: keys.length,
+      }),
+      signal: AbortSignal.timeout(10_000),
+    });
+    if (!response.ok) {
+      logger.warn(`Bulk Jira search failed (HTTP ${response.status}), falling back to per-issue fetches`);
+      return fetchIssuesIndividually(host, keys);
+    }
+    const data = (await response.json()) as { issues?: JiraIssue[] };
+    for (const issue of data.issues ?? []) {
+      if (issue.key) {
+        results.set(issue.key, issue);
+        issueCache.set(`${host}:${issue.key}`, { expires: Date.now() + ISSUE_CACHE_TTL_MS, issue });
+      }
+    }
+    return results;
+  } catch (err) {
+    logger.warn(`Bulk Jira search failed: ${err instanceof Error ? err.message : err}`);
+    return fetchIssuesIndividually(host, keys);
+  }
+}
+
+async function fetchIssuesIndividually(
+  host: string,
+  keys: string[],
+): Promise<Map<string, JiraIssue>> {
+  const results = new Map<string, JiraIssue>();
+  const issues = await Promise.all(keys.map((key) => fetchJiraIssue(host, key)));
+  for (const [i, issue] of issues.entries()) {
+    if (issue) results.set(keys[i], issue);
+  }
+  return results;
+}
+
 /** Fetch the parent issue if the given issue is a subtask. */
 export async function getParentIssue(host: string, issue: JiraIssue): Promise<JiraIssue | null> {
   const fields = issue.fields ?? {};
@@ -93,27 +209,37 @@ export async function getParentIssue(host: string, issue: JiraIssue): Promise<Ji
   return fetchJiraIssue(host, parentKey);
 }
 
-/** Extract plain text from Atlassian Document Format (simplified). */
+/**
+ * Extract plain text from Atlassian Document Format (simplified). Iterative
+ * with an explicit stack, so arbitrarily deep ADF trees can't overflow the
+ * call stack; children are pushed in reverse to keep document order.
+ */
 export function extractTextFromAdf(adf: unknown): string {
   const parts: string[] = [];
+  let total = 0;
+  const stack: unknown[] = [adf];
 
-  function recurse(node: unknown): void {
+  while (stack.length > 0) {
+    const node = stack.pop();
     if (Array.isArray(node)) {
-      for (const item of node) recurse(item);
-      return;
+      for (let i = node.length - 1; i >= 0; i--) stack.push(node[i]);
+      continue;
     }
     if (node && typeof node === "object") {
       const obj = node as AdfNode;
       if (obj.type === "text" && typeof obj.text === "string") {
         parts.push(obj.text);
+        total += obj.text.length;
+        // summarizeJiraIssue truncates the description at 5000 chars, so any
+        // text past that is thrown away — stop walking a huge tree early.
+        if (total > 5000) break;
       }
       if (Array.isArray(obj.content)) {
-        for (const child of obj.content) recurse(child);
+        for (let i = obj.content.length - 1; i >= 0; i--) stack.push(obj.content[i]);
       }
     }
   }
 
-  recurse(adf);
   return parts.join(" ").trim();
 }
 
@@ -159,14 +285,52 @@ export async function buildJiraContext(
 
   logger.info(`Found ${jiraUrls.length} Jira issue(s) in MR`);
 
+  // Two concurrent stages — linked issues, then parents of the subtasks among
+  // them — with the keys for each host collapsed into one bulk search call.
+  // Section order stays keyed to jiraUrls.
+  const keysByHost = new Map<string, string[]>();
+  for (const { host, key } of jiraUrls) {
+    const keys = keysByHost.get(host);
+    if (keys) keys.push(key);
+    else keysByHost.set(host, [key]);
+  }
+
+  const issuesByHost = new Map<string, Map<string, JiraIssue>>();
+  await Promise.all(
+    [...keysByHost].map(async ([host, keys]) => {
+      issuesByHost.set(host, await fetchJiraIssuesBulk(host, keys));
+    }),
+  );
+
+  const parentKeysByHost = new Map<string, Set<string>>();
+  for (const { host, key } of jiraUrls) {
+    const fields = issuesByHost.get(host)?.get(key)?.fields;
+    const parentKey = fields?.issuetype?.subtask ? fields.parent?.key : undefined;
+    if (!parentKey || issuesByHost.get(host)?.has(parentKey)) continue;
+    const keys = parentKeysByHost.get(host);
+    if (keys) keys.add(parentKey);
+    else parentKeysByHost.set(host, new Set([parentKey]));
+  }
+
+  const parentsByHost = new Map<string, Map<string, JiraIssue>>();
+  await Promise.all(
+    [...parentKeysByHost].map(async ([host, keys]) => {
+      logger.info(`Fetching parent issue(s): ${[...keys].join(", ")}`);
+      parentsByHost.set(host, await fetchJiraIssuesBulk(host, [...keys]));
+    }),
+  );
+
   const sections: string[] = [];
   for (const { host, key } of jiraUrls) {
-    const issue = await fetchJiraIssue(host, key);
+    const issue = issuesByHost.get(host)?.get(key);
     if (!issue) continue;
-
     sections.push(summarizeJiraIssue(issue));
 
-    const parent = await getParentIssue(host, issue);
+    const fields = issue.fields;
+    const parentKey = fields?.issuetype?.subtask ? fields.parent?.key : undefined;
+    if (!parentKey) continue;
+    const parent =
+      parentsByHost.get(host)?.get(parentKey) ?? issuesByHost.get(host)?.get(parentKey);
     if (parent) sections.push(summarizeJiraIssue(parent, true));
   }
 
@@ -69,35 +69,26 @@ const PYPI_CLASSIFIER_TO_LICENSE: Record<string, string> = {
   "mozilla public license 2.0 (mpl 2.0)": "MPL-2.0",
 };
 
+// Every copyleft/restrictive keyword yields the same "flagged" verdict, so
+// the checks collapse into one alternation scanned in a single pass. Note
+// "library general public" — the original (pre-2.1) name for the LGPL, which
+// Hibernate and other common Java libs still report.
+const FLAGGED_KEYWORDS =
+  /\bagpl\b|affero general public|\blgpl\b|lesser general public|library general public|\bgpl\b|gnu general public|sspl|server side public|business source license|\bbusl\b|commons clause|creative commons.*non.?commercial|cc.by.nc|european union public licen[cs]e|\beupl\b/;
+
+const ALLOWED_KEYWORDS =
+  /\bmit\b|apache|\bbsd\b|\bisc\b|eclipse public licen[cs]e|\bepl\b|mozilla public licen[cs]e|\bmpl\b|public domain|unlicense|\bcc0\b|python software foundation|\bpsf\b|\bzlib\b/;
+
 /**
  * Keyword-based fallback classifier for free-text license names — Maven POMs
  * and some PyPI packages report a human-readable <name> rather than an SPDX
  * id (e.g. "The Apache Software License, Version 2.0", "GNU Lesser General
- * Public License"). Order matters: check the more specific copyleft variants
- * (AGPL/LGPL) before the plain "gpl" keyword they'd otherwise also match.
+ * Public License"). Flagged keywords are checked first so copyleft variants
+ * win over incidental permissive-sounding words in the same name.
  */
 function classifyByKeyword(normalized: string): LicenseVerdict {
-  if (/\bagpl\b|affero general public/.test(normalized)) return "flagged";
-  // "Library General Public License" is the original (pre-2.1) name for the
-  // LGPL — Hibernate and other common Java libs still report it that way.
-  if (/\blgpl\b|lesser general public|library general public/.test(normalized)) return "flagged";
-  if (/\bgpl\b|gnu general public/.test(normalized)) return "flagged";
-  if (/sspl|server side public/.test(normalized)) return "flagged";
-  if (/business source license|\bbusl\b/.test(normalized)) return "flagged";
-  if (/commons clause/.test(normalized)) return "flagged";
-  if (/creative commons.*non.?commercial|cc.by.nc/.test(normalized)) return "flagged";
-  if (/european union public licen[cs]e|\beupl\b/.test(normalized)) return "flagged";
-
-  if (/\bmit\b/.test(normalized)) return "allowed";
-  if (/apache/.test(normalized)) return "allowed";
-  if (/\bbsd\b/.test(normalized)) return "allowed";
-  if (/\bisc\b/.test(normalized)) return "allowed";
-  if (/eclipse public licen[cs]e|\bepl\b/.test(normalized)) return "allowed";
-  if (/mozilla public licen[cs]e|\bmpl\b/.test(normalized)) return "allowed";
-  if (/public domain|unlicense|\bcc0\b/.test(normalized)) return "allowed";
-  if (/python software foundation|\bpsf\b/.test(normalized)) return "allowed";
-  if (/\bzlib\b/.test(normalized)) return "allowed";
-
+  if (FLAGGED_KEYWORDS.test(normalized)) return "flagged";
+  if (ALLOWED_KEYWORDS.test(normalized)) return "allowed";
   return "unknown";
 }
 
@@ -107,8 +98,21 @@ function classifySingle(normalizedPart: string): LicenseVerdict {
   return classifyByKeyword(normalizedPart);
 }
 
+// Classification is pure and a large manifest change repeats the same handful
+// of license strings ("MIT", "Apache-2.0", ...) across its dependencies, so
+// verdicts are memoized per raw string.
+const verdictCache = new Map<string, LicenseVerdict>();
+
 export function classifyLicense(license: string | null): LicenseVerdict {
   if (!license) return "unknown";
+  const cached = verdictCache.get(license);
+  if (cached) return cached;
+  const verdict = classifyLicenseUncached(license);
+  verdictCache.set(license, verdict);
+  return verdict;
+}
+
+function classifyLicenseUncached(license: string): LicenseVerdict {
   const normalized = license.trim().toLowerCase();
   if (!normalized) return "unknown";
   if (ALLOWED_LICENSES.has(normalized)) return "allowed";
@@ -15,11 +15,33 @@ const PROVIDER_ALIASES: Record<string, string> = {
   bedrock: "amazon-bedrock",
 };
 
+// The pi-ai provider registry is static for the process; build the lookup set
+// once instead of on every parse.
+let knownProvidersCache: Set<string> | null = null;
+
+function knownProviders(): Set<string> {
+  knownProvidersCache ??= new Set<string>(getProviders());
+  return knownProvidersCache;
+}
+
+// Parsing is a pure function of the model string and callers repeat it — e.g.
+// getApiKey alone can parse the same string twice per call — so successful
+// parses are memoized. Failures are not cached; they throw each time.
+const parsedModelCache = new Map<string, ParsedModel>();
+
 /**
  * Parse a model string like "anthropic/claude-sonnet-4-5" into { provider, modelId }.
  * Handles bare names like "claude-sonnet-4-5" or "gpt-5" via auto-detection.
  */
 export function parseModelString(model: string): ParsedModel {
+  const cached = parsedModelCache.get(model);
+  if (cached) return cached;
+  const parsed = parseModelStringUncached(model);
+  parsedModelCache.set(model, parsed);
+  return parsed;
+}
+
+function parseModelStringUncached(model: string): ParsedModel {
   const trimmed = model.trim();
   if (!trimmed) throw new Error("Model name must be provided");
 
@@ -31,7 +53,6 @@ export function parseModelString(model: string): ParsedModel {
   if (parts.length >= 2) {
     const first = parts[0].toLowerCase();
     const provider = PROVIDER_ALIASES[first] ?? first;
-    const knownProviders = new Set<string>(getProviders());
 
     if (provider === "amazon-bedrock") {
       // Strip optional "converse/" prefix from model ID for backwards compatibility.
@@ -42,7 +63,7 @@ export function parseModelString(model: string): ParsedModel {
       return { provider, modelId };
     }
 
-    if (knownProviders.has(provider)) {
+    if (knownProviders().has(provider)) {
       return { provider, modelId: parts.slice(1).join("/") };
     }
 
@@ -142,11 +163,12 @@ export function getApiKey(model?: string): string | null {
     if (provider === "amazon-bedrock") return null;
     const key = getEnvApiKey(provider);
     if (key) return key;
+    throw new Error(
+      `No API key found for provider "${provider}". Set the provider-specific environment variable or LLM_API_KEY.`,
+    );
   }
 
   throw new Error(
-    model
-      ? `No API key found for provider "${parseModelString(model).provider}". Set the provider-specific environment variable or LLM_API_KEY.`
-      : "No LLM API key found. Please set LLM_API_KEY or a provider-specific environment variable.",
+    "No LLM API key found. Please set LLM_API_KEY or a provider-specific environment variable.",
   );
 }
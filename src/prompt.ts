@@ -11,6 +11,18 @@ function getTemplatesDir(): string {
   return resolve(currentDir, "..", "templates");
 }
 
+// The bundled template is immutable for the process lifetime; read it from
+// disk once instead of on every prompt build. Custom prompt files are still
+// read per call so edits between reviews are picked up.
+let defaultTemplateCache: string | null = null;
+
+function loadDefaultTemplate(): string {
+  if (defaultTemplateCache === null) {
+    defaultTemplateCache = readFileSync(resolve(getTemplatesDir(), "tool-review.md"), "utf-8");
+  }
+  return defaultTemplateCache;
+}
+
 export function buildPrReviewPrompt(opts: {
   prUrl: string;
   platform: Platform;
@@ -47,22 +59,22 @@ export function buildPrReviewPrompt(opts: {
     jiraContext,
   } = opts;
 
-  // Step 1: Determine template (always tool submission; rendered to markdown post-hoc)
-  let templateFile: string;
+  // Step 1+2: Load template (always tool submission; rendered to markdown post-hoc)
+  let templateText: string;
   if (customPromptFile) {
-    templateFile = customPromptFile;
-    logger.info(`Using custom prompt file: ${templateFile}`);
+    logger.info(`Using custom prompt file: ${customPromptFile}`);
+    try {
+      templateText = readFileSync(customPromptFile, "utf-8");
+    } catch (err) {
+      throw new Error(`Failed to load prompt template from ${customPromptFile}: ${err}`);
+    }
   } else {
-    templateFile = resolve(getTemplatesDir(), "tool-review.md");
     logger.info("Using tool-based review template");
-  }
-
-  // Step 2: Load template
-  let templateText: string;
-  try {
-    templateText = readFileSync(templateFile, "utf-8");
-  } catch (err) {
-    throw new Error(`Failed to load prompt template from ${templateFile}: ${err}`);
+    try {
+      templateText = loadDefaultTemplate();
+    } catch (err) {
+      throw new Error(`Failed to load bundled prompt template: ${err}`);
+    }
   }
 
   // Validate ref inputs to prevent shell injection via branch/SHA names.
@@ -305,23 +317,29 @@ export function buildPrReviewPrompt(opts: {
       `- \`${gitDiffCmd} -- path/to/file\` - See changes for ONE specific file at a time`;
   }
 
-  // Step 4: Interpolate
-  let prompt = templateText
-    .replace(/\{pr_url\}/g, prUrl)
-    .replace(/\{pr_diff_cmd\}/g, prDiffCmd)
-    .replace(/\{git_diff_cmd\}/g, gitDiffCmd)
-    .replace(/\{diff_command_section\}/g, diffCommandSection)
-    .replace(/\{target_branch\}/g, targetBranch)
-    .replace(/\{diff_explanation\}/g, diffExplanation)
-    .replace(/\{mr_context_section\}/g, contextSection)
-    .replace(/\{mr_notes_section\}/g, notesSection)
-    .replace(/\{mr_reminder_section\}/g, reminderSection)
-    .replace(/\{jira_context_section\}/g, jiraContext ?? "")
-    .replace(/\{incremental_section\}/g, incrementalSection)
-    .replace(/\{embedded_diff_section\}/g, embeddedDiffSection)
-    .replace(/\{diff_fetch_instructions\}/g, diffFetchInstructions)
-    .replace(/\{review_process_section\}/g, reviewProcessSection)
-    .replace(/\{start_instruction\}/g, startInstruction);
+  // Step 4: Interpolate. A single pass with a placeholder map instead of one
+  // full scan (and intermediate multi-KB string) per variable; unknown
+  // {placeholders} are left verbatim, matching the old chain's behavior.
+  const substitutions: Record<string, string> = {
+    pr_url: prUrl,
+    pr_diff_cmd: prDiffCmd,
+    git_diff_cmd: gitDiffCmd,
+    diff_command_section: diffCommandSection,
+    target_branch: targetBranch,
+    diff_explanation: diffExplanation,
+    mr_context_section: contextSection,
+    mr_notes_section: notesSection,
+    mr_reminder_section: reminderSection,
+    jira_context_section: jiraContext ?? "",
+    incremental_section: incrementalSection,
+    embedded_diff_section: embeddedDiffSection,
+    diff_fetch_instructions: diffFetchInstructions,
+    review_process_section: reviewProcessSection,
+    start_instruction: startInstruction,
+  };
+  let prompt = templateText.replace(/\{([a-z_]+)\}/g, (match, name: string) =>
+    name in substitutions ? substitutions[name] : match,
+  );
 
   // Step 5: Append custom instructions
   if (customInstructions) {
@@ -46,29 +46,48 @@ function shouldLog(level: LogLevel): boolean {
   return LEVELS[level] >= LEVELS[currentLevel];
 }
 
+// The ISO prefix up to the seconds is identical for every record logged in the
+// same second — cache it and append only the milliseconds, instead of paying a
+// Date allocation + toISOString per log line.
+let lastTimestampSec = -1;
+let lastTimestampPrefix = "";
+
 function timestamp(): string {
-  return new Date().toISOString();
+  const now = Date.now();
+  const sec = Math.floor(now / 1000);
+  if (sec !== lastTimestampSec) {
+    lastTimestampSec = sec;
+    lastTimestampPrefix = new Date(sec * 1000).toISOString().slice(0, 19);
+  }
+  return `${lastTimestampPrefix}.${String(now - sec * 1000).padStart(3, "0")}Z`;
 }
 
+// The colored level tags never change; render them once instead of running
+// chalk's ANSI wrapping on every log line.
+const DEBUG_TAG = chalk.gray("DEBUG");
+const INFO_TAG = chalk.blue("INFO");
+const WARN_TAG = chalk.yellow("WARN");
+const ERROR_TAG = chalk.red("ERROR");
+
 export const logger = {
   debug(msg: string): void {
     if (shouldLog("debug")) {
-      writeStderrSync(`${chalk.gray(timestamp())} ${chalk.gray("DEBUG")} ${msg}\n`);
+      writeStderrSync(`${chalk.gray(timestamp())} ${DEBUG_TAG} ${msg}\n`);
     }
   },
   info(msg: string): void {
     if (shouldLog("info")) {
-      writeStderrSync(`${chalk.gray(timestamp())} ${chalk.blue("INFO")}  ${msg}\n`);
+      writeStderrSync(`${chalk.gray(timestamp())} ${INFO_TAG}  ${msg}\n`);
     }
   },
   warn(msg: string): void {
     if (shouldLog("warn")) {
-      writeStderrSync(`${chalk.gray(timestamp())} ${chalk.yellow("WARN")}  ${msg}\n`);
+      writeStderrSync(`${chalk.gray(timestamp())} ${WARN_TAG}  ${msg}\n`);
     }
   },
   error(msg: string): void {
     if (shouldLog("error")) {
-      writeStderrSync(`${chalk.gray(timestamp())} ${chalk.red("ERROR")} ${msg}\n`);
+      writeStderrSync(`${chalk.gray(timestamp())} ${ERROR_TAG} ${msg}\n`);
     }
   },
 };
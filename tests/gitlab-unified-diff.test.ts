@@ -10,7 +10,7 @@ vi.mock("../src/utils/exec.js", () => ({
 }));
 
 // Import after the mock is registered.
-const { getGitlabMrUnifiedDiff } = await import("../src/gitlab.js");
+const { clearGitlabDiffCache, getGitlabMrUnifiedDiff } = await import("../src/gitlab.js");
 
 /** Return `pages` in order across successive execJson calls, then []. */
 function respondWithPages(pages: Array<Array<Record<string, unknown>>>): void {
@@ -21,6 +21,7 @@ function respondWithPages(pages: Array<Array<Record<string, unknown>>>): void {
 describe("getGitlabMrUnifiedDiff", () => {
   afterEach(() => {
     mocks.execJson.mockReset();
+    clearGitlabDiffCache();
   });
 
   it("reconstructs a git-format section for a modified file", async () => {
@@ -131,7 +132,7 @@ describe("getGitlabMrUnifiedDiff", () => {
   });
 
   it("paginates until a short page and aggregates all files", async () => {
-    const page1 = Array.from({ length: 50 }, (_, i) => ({
+    const page1 = Array.from({ length: 100 }, (_, i) => ({
       old_path: `f${i}.ts`,
       new_path: `f${i}.ts`,
       new_file: false,
@@ -141,8 +142,8 @@ describe("getGitlabMrUnifiedDiff", () => {
     }));
     const page2 = [
       {
-        old_path: "f50.ts",
-        new_path: "f50.ts",
+        old_path: "f100.ts",
+        new_path: "f100.ts",
         new_file: false,
         renamed_file: false,
         deleted_file: false,
@@ -152,7 +153,7 @@ describe("getGitlabMrUnifiedDiff", () => {
     respondWithPages([page1, page2]);
 
     const result = await getGitlabMrUnifiedDiff("owner", "repo", 7);
-    expect(result?.files).toHaveLength(51);
+    expect(result?.files).toHaveLength(101);
     expect(mocks.execJson).toHaveBeenCalledTimes(2);
   });
 
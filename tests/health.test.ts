@@ -9,8 +9,10 @@ vi.mock("../src/utils/exec.js", () => ({
 const ORIGINAL_ENV = { ...process.env };
 
 describe("health checks", () => {
-  beforeEach(() => {
+  beforeEach(async () => {
     execMock.mockReset();
+    const { clearHealthCheckCache } = await import("../src/health.js");
+    clearHealthCheckCache();
     process.env = { ...ORIGINAL_ENV };
     delete process.env.LLM_API_KEY;
     delete process.env.ANTHROPIC_API_KEY;
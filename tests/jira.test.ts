@@ -4,6 +4,7 @@ import {
   extractTextFromAdf,
   summarizeJiraIssue,
   buildJiraContext,
+  clearJiraIssueCache,
 } from "../src/jira.js";
 
 describe("extractJiraUrls", () => {
@@ -97,6 +98,7 @@ describe("buildJiraContext", () => {
 
   beforeEach(() => {
     mockFetch.mockReset();
+    clearJiraIssueCache();
     vi.stubGlobal("fetch", mockFetch);
     process.env.JIRA_EMAIL = "bot@company.com";
     process.env.JIRA_API_KEY = "token";